@@ -1,16 +1,106 @@
-from homeassistant.const import CONF_NAME, CONF_HOST, Platform, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant
+import time
+
+import voluptuous as vol
+from homeassistant.const import CONF_NAME, CONF_HOST, CONF_ENTITY_ID, Platform, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_POLLING_RATE
+from .broadcast import BroadcastResult, async_broadcast, async_resolve_devices, async_send_keys
+from .const import LOGGER, DOMAIN, CONF_POLLING_RATE, CONF_GROUPS, CONF_ENTITIES, CONF_COMMAND, CONF_MAX_CONCURRENCY
+from .const import CONF_TIMEOUT, SERVICE_BROADCAST
+from .const import DEFAULT_BROADCAST_CONCURRENCY, MAX_BROADCAST_CONCURRENCY
+from .const import DEFAULT_BROADCAST_TIMEOUT, MAX_BROADCAST_TIMEOUT
 from .coordinator import SamsungCoordinator
 from .device import SamsungDevice
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.REMOTE]
 
+GROUP_SCHEMA = vol.Schema({
+    vol.Required(CONF_NAME): cv.string,
+    vol.Required(CONF_ENTITIES): cv.entity_ids,
+    vol.Optional(CONF_MAX_CONCURRENCY, default=DEFAULT_BROADCAST_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_BROADCAST_CONCURRENCY)
+    ),
+    vol.Optional(CONF_TIMEOUT, default=DEFAULT_BROADCAST_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=MAX_BROADCAST_TIMEOUT)
+    ),
+})
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema({
+            vol.Optional(CONF_GROUPS, default=[]): vol.All(cv.ensure_list, [GROUP_SCHEMA]),
+        })
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+BROADCAST_SCHEMA = vol.Schema({
+    vol.Required(CONF_ENTITY_ID): vol.All(cv.entity_ids, vol.Length(min=1)),
+    vol.Required(CONF_COMMAND): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(CONF_MAX_CONCURRENCY, default=DEFAULT_BROADCAST_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_BROADCAST_CONCURRENCY)
+    ),
+    vol.Optional(CONF_TIMEOUT, default=DEFAULT_BROADCAST_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=MAX_BROADCAST_TIMEOUT)
+    ),
+})
+
 type SamsungConfigEntry = ConfigEntry[SamsungCoordinator]
 
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up broadcast service and TV groups."""
+
+    async def broadcast(call: ServiceCall) -> ServiceResponse:
+        devices, unresolved = async_resolve_devices(hass, call.data[CONF_ENTITY_ID])
+        if not devices:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="no_devices",
+                translation_placeholders={
+                    "entities": ", ".join(f"{entity_id} ({reason})" for entity_id, reason in unresolved.items())
+                },
+            )
+        for entity_id, reason in unresolved.items():
+            LOGGER.warning(f"Broadcast not sent to {entity_id}: {reason}")
+
+        command = call.data[CONF_COMMAND]
+        start = time.monotonic()
+        results = await async_broadcast(
+            devices,
+            lambda device: async_send_keys(device, command),
+            call.data[CONF_MAX_CONCURRENCY],
+            call.data[CONF_TIMEOUT]
+        )
+        results += [BroadcastResult.unresolved(entity_id, reason) for entity_id, reason in unresolved.items()]
+
+        return {
+            "results": [result.as_dict() for result in results],
+            "total_time": time.monotonic() - start,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BROADCAST,
+        broadcast,
+        schema=BROADCAST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    for group in config.get(DOMAIN, {}).get(CONF_GROUPS, []):
+        hass.async_create_task(
+            async_load_platform(hass, Platform.REMOTE, DOMAIN, group, config)
+        )
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: SamsungConfigEntry) -> bool:
     """Set up Samsung TV from config entry."""
     session = async_create_clientsession(hass, verify_ssl=False)
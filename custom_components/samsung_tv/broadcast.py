@@ -0,0 +1,111 @@
+import asyncio
+import dataclasses
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry
+
+from .const import LOGGER, DOMAIN, DATA_GROUPS, DEFAULT_BROADCAST_CONCURRENCY, DEFAULT_BROADCAST_TIMEOUT
+from .device import SamsungDevice
+
+
+@dataclasses.dataclass(frozen=True)
+class BroadcastResult:
+    name: str
+    host: Optional[str]
+    success: bool
+    latency: float
+    queued: float = 0.0
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def unresolved(cls, entity_id: str, reason: str) -> "BroadcastResult":
+        return cls(entity_id, None, False, 0.0, error=reason)
+
+
+def _expand_groups(hass: HomeAssistant, entity_ids: Iterable[str]) -> List[str]:
+    groups = hass.data.get(DATA_GROUPS, {})
+    expanded = []
+    seen = set()
+    pending = list(entity_ids)
+    while pending:
+        entity_id = pending.pop(0)
+        if entity_id in seen:
+            continue
+        seen.add(entity_id)
+        if entity_id in groups:
+            pending.extend(groups[entity_id])
+        else:
+            expanded.append(entity_id)
+    return expanded
+
+
+@callback
+def async_resolve_devices(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str]
+) -> Tuple[List[SamsungDevice], Dict[str, str]]:
+    """Map samsung_tv entity ids (group members included) to their devices, one device per config entry.
+
+    Returns resolved devices and the entity ids which could not be resolved, with the reason.
+    """
+    registry = entity_registry.async_get(hass)
+    devices = {}
+    unresolved = {}
+    for entity_id in _expand_groups(hass, entity_ids):
+        registry_entry = registry.async_get(entity_id)
+        if registry_entry is None or registry_entry.platform != DOMAIN:
+            unresolved[entity_id] = "not a samsung_tv entity"
+            continue
+        entry = hass.config_entries.async_get_entry(registry_entry.config_entry_id)
+        if entry is None or entry.state is not ConfigEntryState.LOADED:
+            unresolved[entity_id] = "not loaded"
+            continue
+        devices.setdefault(entry.entry_id, entry.runtime_data.device)
+    return list(devices.values()), unresolved
+
+
+async def async_send_keys(device: SamsungDevice, command: Iterable[str]) -> None:
+    for key in command:
+        await device.async_click_key(key)
+
+
+async def async_broadcast(
+    devices: Iterable[SamsungDevice],
+    action: Callable[[SamsungDevice], Awaitable[None]],
+    max_concurrency: int = DEFAULT_BROADCAST_CONCURRENCY,
+    timeout: float = DEFAULT_BROADCAST_TIMEOUT
+) -> List[BroadcastResult]:
+    """Run action on every device concurrently, at most max_concurrency at once, each limited to timeout seconds.
+
+    latency covers the action itself, queued is the time spent waiting for a free slot before it.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(device: SamsungDevice) -> BroadcastResult:
+        enqueued = time.monotonic()
+        async with semaphore:
+            start = time.monotonic()
+            queued = start - enqueued
+            error = None
+            try:
+                async with asyncio.timeout(timeout):
+                    await action(device)
+            except TimeoutError:
+                error = "timeout"
+            except Exception as err:
+                error = str(err) or type(err).__name__
+            latency = time.monotonic() - start
+
+        if error is not None:
+            LOGGER.warning(f"Broadcast to {device.name} ({device.host}) failed: {error}")
+        return BroadcastResult(device.name, device.host, error is None, latency, queued, error)
+
+    return list(await asyncio.gather(*(run(device) for device in devices)))
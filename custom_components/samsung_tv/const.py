@@ -13,6 +13,16 @@ CONF_POLLING_RATE = "polling_rate"
 
 CONF_MAC = "mac"
 
+CONF_GROUPS = "groups"
+CONF_ENTITIES = "entities"
+CONF_COMMAND = "command"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_TIMEOUT = "timeout"
+
+DATA_GROUPS = "samsung_tv_groups"
+
+SERVICE_BROADCAST = "broadcast"
+
 KEY_POWER = "KEY_POWER"
 KEY_MUTE = "KEY_MUTE"
 KEY_VOLUME_UP = "KEY_VOLUP"
@@ -21,6 +31,10 @@ KEY_PLAY = "KEY_PLAY"
 KEY_PAUSE = "KEY_PAUSE"
 
 DEFAULT_POLLING_RATE = 10
+DEFAULT_BROADCAST_CONCURRENCY = 8
+MAX_BROADCAST_CONCURRENCY = 64
+DEFAULT_BROADCAST_TIMEOUT = 10
+MAX_BROADCAST_TIMEOUT = 120
 
 WAIT_FOR_CONNECTION_TIMEOUT = 10
 WAIT_FOR_AUTH_TIMEOUT = 60
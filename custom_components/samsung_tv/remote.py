@@ -1,10 +1,16 @@
 from typing import Any, Iterable
 
 from homeassistant.components.remote import RemoteEntity
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import CONF_NAME, STATE_ON
+from homeassistant.core import HomeAssistant, Event, EventStateChangedData, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import slugify
 
 from . import SamsungConfigEntry, SamsungDevice
+from .broadcast import async_broadcast, async_resolve_devices, async_send_keys
+from .const import LOGGER, DOMAIN, CONF_ENTITIES, CONF_MAX_CONCURRENCY, CONF_TIMEOUT, DATA_GROUPS
 from .entity import SamsungEntity
 
 
@@ -17,6 +23,24 @@ async def async_setup_entry(
     async_add_entities([SamsungRemote(coordinator=coordinator)])
 
 
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None
+) -> None:
+    if discovery_info is None:
+        return
+    async_add_entities([
+        SamsungGroupRemote(
+            discovery_info[CONF_NAME],
+            discovery_info[CONF_ENTITIES],
+            discovery_info[CONF_MAX_CONCURRENCY],
+            discovery_info[CONF_TIMEOUT]
+        )
+    ])
+
+
 class SamsungRemote(SamsungEntity, RemoteEntity):
     _attr_name = None
 
@@ -36,5 +60,58 @@ class SamsungRemote(SamsungEntity, RemoteEntity):
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         device: SamsungDevice = self.coordinator.device
-        for key in command:
-            await device.async_click_key(key)
\ No newline at end of file
+        await async_send_keys(device, command)
+
+
+class SamsungGroupRemote(RemoteEntity):
+    _attr_should_poll = False
+    _entity_ids: list[str]
+    _max_concurrency: int
+    _timeout: float
+
+    def __init__(self, name: str, entity_ids: list[str], max_concurrency: int, timeout: float) -> None:
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_group_{slugify(name)}"
+        self._entity_ids = entity_ids
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+        self._attr_extra_state_attributes = {"entity_id": entity_ids}
+
+    async def async_added_to_hass(self) -> None:
+        groups = self.hass.data.setdefault(DATA_GROUPS, {})
+        groups[self.entity_id] = self._entity_ids
+        self.async_on_remove(lambda: groups.pop(self.entity_id, None))
+
+        @callback
+        def _handle_member_update(event: Event[EventStateChangedData]) -> None:
+            self._update_is_on()
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, self._entity_ids, _handle_member_update)
+        )
+        self._update_is_on()
+
+    @callback
+    def _update_is_on(self) -> None:
+        self._attr_is_on = any(
+            (state := self.hass.states.get(entity_id)) is not None and state.state == STATE_ON
+            for entity_id in self._entity_ids
+        )
+
+    async def _async_broadcast(self, action) -> None:
+        devices, unresolved = async_resolve_devices(self.hass, self._entity_ids)
+        for entity_id, reason in unresolved.items():
+            LOGGER.warning(f"{self.name}: command not sent to {entity_id}: {reason}")
+
+        await async_broadcast(devices, action, self._max_concurrency, self._timeout)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        await self._async_broadcast(lambda device: device.async_turn_off())
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        await self._async_broadcast(lambda device: device.async_turn_on())
+
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
+        command = list(command)
+        await self._async_broadcast(lambda device: async_send_keys(device, command))